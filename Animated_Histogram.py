@@ -1,11 +1,12 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, FFMpegWriter, PillowWriter
-from scipy.stats import norm
+from matplotlib.animation import FuncAnimation, FFMpegWriter
+from matplotlib.colors import to_rgba
 import shutil
 
+from gif_palette import FixedPaletteGifWriter, build_palette
+
 # Techy color palette
-SAMPLE_COLOR = '#1ef9d3'
 MEAN_GRADIENT = ['#00bcd4', '#2196f3', '#3f51b5', '#00acc1']
 CURVE_COLOR = '#00c2ff'
 GRID_COLOR = '#0d1117'
@@ -13,101 +14,162 @@ TITLE_COLOR = '#00ffe7'
 LABEL_COLOR = '#ffde57'
 BAND_COLOR = '#333d52'
 
+# Most bins the sampling-distribution histogram ever uses
+MEAN_BINS = 30
+
+# RGBA face color for each bar position, alternating along MEAN_GRADIENT.
+# The 14-bin sample histogram takes the first entries of the same list.
+BAR_COLORS = [to_rgba(MEAN_GRADIENT[i % len(MEAN_GRADIENT)]) for i in range(MEAN_BINS)]
+
+# Palette for the Pillow GIF fallback: bar, curve and text colors plus the
+# bar-edge and grid shades, each blended over both backgrounds
+GIF_PALETTE = build_palette(
+    [*MEAN_GRADIENT, CURVE_COLOR, TITLE_COLOR, LABEL_COLOR,
+     '#38006b', '#17003b', '#222d3d'],
+    [GRID_COLOR, BAND_COLOR])
+
 # Set font globally
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['xtick.color'] = LABEL_COLOR
 plt.rcParams['ytick.color'] = LABEL_COLOR
 
+rng = np.random.default_rng()
+
+
+def _fast_norm_pdf(x, mu, sigma):
+    """Normal PDF in closed form, avoiding scipy.stats dispatch overhead"""
+    inv = 1.0 / (sigma * np.sqrt(2 * np.pi))
+    return inv * np.exp(-0.5 * ((x - mu) / sigma) ** 2)
 
-def animated_clt(population, sample_size=30, n_frames=200):
-    """Animate the CLT as more samples are collected"""
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8), facecolor=GRID_COLOR)
 
-    # Storage
-    sample_means = []
+def animated_clt(population, sample_size=30, n_frames=200, dpi=100):
+    """Animate the CLT as more samples are collected"""
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 8), dpi=dpi,
+                                   facecolor=GRID_COLOR)
+
+    # Draw every frame's sample up front in one vectorized call
+    samples = rng.choice(population, size=(n_frames, sample_size), replace=True)
+    all_means = samples.mean(axis=1)
+
+    # Running mean/std of the sampling distribution after each frame, from
+    # cumulative sums rather than re-reducing the growing prefix every frame
+    n_seen = np.arange(1, n_frames + 1)
+    running_mu = np.cumsum(all_means) / n_seen
+    running_sigma = np.sqrt(np.maximum(
+        np.cumsum(all_means ** 2) / n_seen - running_mu ** 2, 0))
+    running_min = np.minimum.accumulate(all_means)
+    running_max = np.maximum.accumulate(all_means)
+
+    # np.linspace has no out=, so the curve's x values are a 0..1 grid scaled
+    # onto [running_min, running_max] in place
+    pdf_grid = np.linspace(0, 1, 100)
+    x_pdf = np.empty_like(pdf_grid)
+
+    # Fixed bins so the bar artists can be reused across frames
+    sample_bins = np.linspace(1, 101, 15)
+    sample_counts = np.array([np.histogram(s, bins=sample_bins)[0] for s in samples])
+
+    # Each frame's histogram of the means so far, on min(30, count // 5) bins
+    # over their own range, for frames with more than 5 means. Knowing every
+    # frame's densities up front gives a y-limit no frame's bars can exceed.
+    mean_hists = [np.histogram(all_means[:count], bins=min(MEAN_BINS, count // 5),
+                               density=True)
+                  for count in range(6, n_frames + 1)]
+    peak_density = max((density.max() for density, _ in mean_hists), default=1.0)
+
+    # Top plot: Current sample distribution
+    ax1.patch.set_facecolor(BAND_COLOR)
+    sample_bars = ax1.bar(sample_bins[:-1], np.zeros(len(sample_bins) - 1),
+                          width=np.diff(sample_bins), align='edge',
+                          color=BAR_COLORS[:len(sample_bins) - 1],
+                          alpha=0.8, edgecolor='#38006b', linewidth=2)
+
+    ax1.set_title(f'Current Sample (n={sample_size})',
+                  fontweight='bold', color=TITLE_COLOR, fontsize=16)
+    ax1.set_xlim(0, 100)
+    ax1.set_ylim(0, sample_counts.max() * 1.1)
+    ax1.set_ylabel('Frequency', color=LABEL_COLOR, fontsize=12)
+    ax1.grid(True, color='#222d3d', linestyle='-', alpha=0.3)
+    ax1.tick_params(axis='x', colors=LABEL_COLOR)
+    ax1.tick_params(axis='y', colors=LABEL_COLOR)
+
+    # Bottom plot: Sampling distribution evolution
+    ax2.patch.set_facecolor(BAND_COLOR)
+    mean_bars = ax2.bar(np.zeros(MEAN_BINS), np.zeros(MEAN_BINS), align='edge',
+                        color=BAR_COLORS[:MEAN_BINS],
+                        alpha=0.85, edgecolor='#17003b', linewidth=2)
+
+    # Normal curve and mean marker, filled in once there is enough data
+    curve_line, = ax2.plot([], [], '-', linewidth=3, color=CURVE_COLOR, alpha=0.9)
+    mean_line = ax2.axvline(all_means.mean(), color=TITLE_COLOR, linestyle='--',
+                            linewidth=2.5, label='mu, sigma')
+    legend = ax2.legend(facecolor=BAND_COLOR, edgecolor=GRID_COLOR,
+                        fontsize=11, labelcolor=LABEL_COLOR)
+    # Sample count sits inside the axes, the only area blitting redraws
+    count_text = ax2.text(0.02, 0.92, '', transform=ax2.transAxes,
+                          color=TITLE_COLOR, fontsize=12, fontweight='bold')
+
+    ax2.set_title('Sampling Distribution',
+                  fontweight='bold', color=TITLE_COLOR, fontsize=16)
+    ax2.set_xlim(all_means.min(), all_means.max())
+    ax2.set_ylim(0, peak_density * 1.1)
+    ax2.set_xlabel('Sample Mean', color=LABEL_COLOR, fontsize=13)
+    ax2.set_ylabel('Density', color=LABEL_COLOR, fontsize=13)
+    ax2.grid(True, color='#222d3d', linestyle='-', alpha=0.3)
+    ax2.tick_params(axis='x', colors=LABEL_COLOR)
+    ax2.tick_params(axis='y', colors=LABEL_COLOR)
+
+    artists = [*sample_bars, *mean_bars, curve_line, mean_line, legend, count_text]
 
     def init():
-        ax1.clear()
-        ax2.clear()
-        return ax1, ax2
+        for patch in sample_bars:
+            patch.set_height(0)
+        for patch in mean_bars:
+            patch.set_visible(False)
+        curve_line.set_data([], [])
+        mean_line.set_visible(False)
+        legend.set_visible(False)
+        count_text.set_text('')
+        return artists
 
     def update(frame):
-        # Take one sample
-        sample = np.random.choice(population, size=sample_size, replace=True)
-        sample_means.append(sample.mean())
-
-        # Top plot: Current sample distribution
-        ax1.clear()
-        ax1.patch.set_facecolor(BAND_COLOR)
-        counts, bins, patches = ax1.hist(
-            sample,
-            bins=np.linspace(1, 101, 15),
-            alpha=0.8,
-            color=SAMPLE_COLOR,
-            edgecolor='#38006b',
-            linewidth=2,
-        )
-
-        # Apply gradient to histogram bars
-        for i, patch in enumerate(patches):
-            color_idx = i % len(MEAN_GRADIENT)
-            patch.set_facecolor(MEAN_GRADIENT[color_idx])
-
-        ax1.set_title(f'Current Sample (n={sample_size})',
-                      fontweight='bold', color=TITLE_COLOR, fontsize=16)
-        ax1.set_xlim(0, 100)
-        ax1.set_ylabel('Frequency', color=LABEL_COLOR, fontsize=12)
-        ax1.grid(True, color='#222d3d', linestyle='-', alpha=0.3)
-        ax1.tick_params(axis='x', colors=LABEL_COLOR)
-        ax1.tick_params(axis='y', colors=LABEL_COLOR)
-
-        # Bottom plot: Sampling distribution evolution
-        ax2.clear()
-        ax2.patch.set_facecolor(BAND_COLOR)
-
-        if len(sample_means) > 5:
-            counts2, bins2, patches2 = ax2.hist(
-                sample_means,
-                bins=min(30, len(sample_means) // 5),
-                density=True,
-                alpha=0.85,
-                color=CURVE_COLOR,
-                edgecolor='#17003b',
-                linewidth=2,
-            )
-
-            # Apply gradient to histogram bars
-            for i, patch in enumerate(patches2):
-                color_idx = i % len(MEAN_GRADIENT)
-                patch.set_facecolor(MEAN_GRADIENT[color_idx])
+        count = frame + 1
+
+        for patch, bin_count in zip(sample_bars, sample_counts[frame]):
+            patch.set_height(bin_count)
+
+        if count > 5:
+            # Move the persistent bars onto this frame's bins; spares stay hidden
+            density, edges = mean_hists[count - 6]
+            for i, patch in enumerate(mean_bars):
+                if i < len(density):
+                    patch.set_x(edges[i])
+                    patch.set_width(edges[i + 1] - edges[i])
+                    patch.set_height(density[i])
+                patch.set_visible(i < len(density))
 
             # Fit normal curve if enough data
-            if len(sample_means) > 30:
-                mu = float(np.mean(sample_means))
-                sigma = float(np.std(sample_means))
-                x = np.linspace(min(sample_means), max(sample_means), 100)
+            if count > 30:
+                mu = float(running_mu[frame])
+                sigma = float(running_sigma[frame])
+                lo, hi = running_min[frame], running_max[frame]
+                x = np.multiply(pdf_grid, hi - lo, out=x_pdf)
+                x += lo
 
                 # Normal curve
-                ax2.plot(x, norm.pdf(x, mu, sigma), '-',
-                         linewidth=3, color=CURVE_COLOR, alpha=0.9)
+                curve_line.set_data(x, _fast_norm_pdf(x, mu, sigma))
 
-                ax2.axvline(mu, color=TITLE_COLOR, linestyle='--',
-                            linewidth=2.5, label=f'mu={mu:.2f}, sigma={sigma:.2f}')
-                ax2.legend(facecolor=BAND_COLOR, edgecolor=GRID_COLOR,
-                           fontsize=11, labelcolor=LABEL_COLOR)
+                mean_line.set_xdata([mu, mu])
+                mean_line.set_visible(True)
+                legend.get_texts()[0].set_text(f'mu={mu:.2f}, sigma={sigma:.2f}')
+                legend.set_visible(True)
 
-        ax2.set_title(f'Sampling Distribution ({len(sample_means)} samples)',
-                      fontweight='bold', color=TITLE_COLOR, fontsize=16)
-        ax2.set_xlabel('Sample Mean', color=LABEL_COLOR, fontsize=13)
-        ax2.set_ylabel('Density', color=LABEL_COLOR, fontsize=13)
-        ax2.grid(True, color='#222d3d', linestyle='-', alpha=0.3)
-        ax2.tick_params(axis='x', colors=LABEL_COLOR)
-        ax2.tick_params(axis='y', colors=LABEL_COLOR)
+        count_text.set_text(f'{count} samples')
 
-        return ax1, ax2
+        return artists
 
     anim = FuncAnimation(fig, update, frames=n_frames, init_func=init,
-                         interval=80, blit=False, repeat=False)
+                         interval=80, blit=True, repeat=False)
     plt.tight_layout()
     return anim
 
@@ -118,11 +180,14 @@ def animated_clt(population, sample_size=30, n_frames=200):
 
 if __name__ == "__main__":
     # Create population
-    population = np.random.randint(1, 101, size=1000)
+    population = rng.integers(1, 101, size=1000)
+
+    # Render at the figure's own dpi so saving never has to re-rasterize
+    dpi = 100
 
     # Generate animation
     print("Generating CLT animation...")
-    anim = animated_clt(population, sample_size=30, n_frames=200)
+    anim = animated_clt(population, sample_size=30, n_frames=200, dpi=dpi)
 
     # Save as MP4 (requires ffmpeg installed and on PATH)
     print("Saving as MP4...")
@@ -131,16 +196,24 @@ if __name__ == "__main__":
         print("Skipping MP4: ffmpeg not found on PATH. Install ffmpeg or add it to PATH to enable MP4 output.")
     else:
         try:
-            writer_mp4 = FFMpegWriter(fps=20, metadata=dict(artist='CLT Demo'), bitrate=1800)
-            anim.save('clt_animation.mp4', writer=writer_mp4, dpi=150)
+            writer_mp4 = FFMpegWriter(fps=20, codec='libx264', metadata=dict(artist='CLT Demo'),
+                                      bitrate=1800,
+                                      extra_args=['-pix_fmt', 'yuv420p', '-preset', 'ultrafast'])
+            anim.save('clt_animation.mp4', writer=writer_mp4, dpi=dpi,
+                      savefig_kwargs={'facecolor': GRID_COLOR})
             print("Saved as clt_animation.mp4")
         except (FileNotFoundError, OSError) as e:
             print(f"Skipping MP4 due to ffmpeg error: {e}")
 
-    # Save as GIF (alternative)
+    # Save as GIF (alternative). ffmpeg builds the GIF palette natively, which
+    # is much faster than Pillow's per-frame quantization, so prefer it.
     print("Saving as GIF...")
-    writer_gif = PillowWriter(fps=12, metadata=dict(artist='CLT Demo'))
-    anim.save('clt_animation1.gif', writer=writer_gif, dpi=100)
+    if ffmpeg_path is None:
+        writer_gif = FixedPaletteGifWriter(GIF_PALETTE, fps=12, metadata=dict(artist='CLT Demo'))
+    else:
+        writer_gif = FFMpegWriter(fps=12, metadata=dict(artist='CLT Demo'))
+    anim.save('clt_animation1.gif', writer=writer_gif, dpi=dpi,
+              savefig_kwargs={'facecolor': GRID_COLOR})
     print("Saved as clt_animation.gif")
 
     # Display the animation (optional)
@@ -151,4 +224,6 @@ if __name__ == "__main__":
     print("   - Upload MP4 to YouTube/Drive and embed link")
     print("   - Or drag-and-drop GIF directly into Medium editor")
 
+    plt.close('all')
+
 
@@ -1,21 +1,19 @@
 import numpy as np
 
-s = np.random.randint(1,101, size=1000)
-sample_means = []  # use a list; append means, convert to array after loop
-for i in range(10):
+rng = np.random.default_rng()
 
-    sample_30_random = np.random.choice(s, size=30, replace=True)
+s = rng.integers(1,101, size=1000)
+n_samples = 10
+sample_means = np.empty(n_samples, dtype=np.float64)  # preallocated, filled in place
+for i in range(n_samples):
 
-    # minimal fix: append mean instead of using nonexistent NumPy insert
-    sample_means.append(np.mean(sample_30_random))
+    sample_30_random = rng.choice(s, size=30, replace=True)
 
-# convert to ndarray for downstream NumPy ops
-sample_means = np.array(sample_means)
+    sample_means[i] = np.mean(sample_30_random)
 
 
 
 import matplotlib.pyplot as plt
-from scipy.stats import norm
 
 def plot_clt_results(sample_means, title="Central Limit Theorem Visualization"):
     """
@@ -35,7 +33,7 @@ def plot_clt_results(sample_means, title="Central Limit Theorem Visualization"):
     x = np.linspace(sample_means.min(), sample_means.max(), 100)
     
     # Plot normal distribution overlay
-    normal_curve = norm.pdf(x, mu, sigma)
+    normal_curve = (1 / (sigma * np.sqrt(2 * np.pi))) * np.exp(-0.5 * ((x - mu) / sigma) ** 2)
     plt.plot(x, normal_curve, 'r-', linewidth=2, 
              label=f'Normal Curve\nmu={mu:.2f}, sigma={sigma:.2f}')
     
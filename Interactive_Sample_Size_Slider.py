@@ -1,19 +1,34 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, PillowWriter
-from scipy.stats import norm
+from matplotlib.animation import FuncAnimation, FFMpegWriter
+from matplotlib.colors import to_rgba
+import shutil
+
+from gif_palette import FixedPaletteGifWriter, build_palette
+from sampling import compute_means
 
 # Techy cyberpunk color palette
 SAMPLE_COLOR = '#1ef9d3'
 MEAN_GRADIENT = ['#4c47e4', '#792ec7', '#be23c4', '#f174ea']
-CURVE_COLOR = '#ff24a5'
 GRID_COLOR = '#0d1117'
 TITLE_COLOR = '#00ffe7'
 LABEL_COLOR = '#ffde57'
 BAND_COLOR = '#333d52'
-POPULATION_COLOR = '#08F7FE'
 NORMAL_CURVE_COLOR = '#FE53BB'
 
+# Bins in the sampling-distribution histogram, spread over each frame's means
+MEAN_BINS = 30
+
+# Precomputed RGBA bar colors, long enough for the mean histogram and the
+# 20-bin population histogram alike
+BAR_COLORS = [to_rgba(MEAN_GRADIENT[i % len(MEAN_GRADIENT)]) for i in range(MEAN_BINS)]
+
+# Fixed GIF palette for when ffmpeg is missing; 'white' is the glow curve's core
+GIF_PALETTE = build_palette(
+    [*MEAN_GRADIENT, TITLE_COLOR, LABEL_COLOR, NORMAL_CURVE_COLOR, 'white',
+     '#38006b', '#17003b', '#2A3459'],
+    [GRID_COLOR, BAND_COLOR])
+
 # Set matplotlib style globally
 plt.style.use('dark_background')
 plt.rcParams['figure.facecolor'] = GRID_COLOR
@@ -26,112 +41,153 @@ plt.rcParams['ytick.color'] = LABEL_COLOR
 plt.rcParams['grid.color'] = '#2A3459'
 plt.rcParams['font.family'] = 'DejaVu Sans'
 
-def create_clt_gif(population, output_filename='clt_interactive.gif'):
+rng = np.random.default_rng()
+
+
+def _fast_norm_pdf(x, mu, sigma):
+    """
+    Normal PDF in closed form, avoiding scipy.stats dispatch overhead
+    """
+    inv = 1.0 / (sigma * np.sqrt(2 * np.pi))
+    return inv * np.exp(-0.5 * ((x - mu) / sigma) ** 2)
+
+
+def create_clt_gif(population, output_filename='clt_interactive.gif', dpi=100):
     """
     Create an animated GIF showing CLT with varying sample sizes
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6), facecolor=GRID_COLOR)
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6), dpi=dpi, facecolor=GRID_COLOR)
     
     # Sample sizes to animate through
     sample_sizes = list(range(5, 105, 5))  # 5, 10, 15, ..., 100
     n_samples = 1000  # Fixed number of samples
     
+    # LEFT PLOT: Population distribution (constant, drawn once)
+    ax1.patch.set_facecolor(BAND_COLOR)
+    counts1, bins1 = np.histogram(population, bins=20, density=True)
+    ax1.bar(
+        bins1[:-1], 
+        counts1, 
+        width=np.diff(bins1), 
+        align='edge', 
+        alpha=0.8, 
+        color=BAR_COLORS[:len(counts1)],
+        edgecolor='#38006b', 
+        linewidth=2
+    )
+    
+    ax1.set_title('Population Distribution', 
+                 fontweight='bold', color=TITLE_COLOR, fontsize=16)
+    ax1.set_xlabel('Value', color=LABEL_COLOR, fontsize=13)
+    ax1.set_ylabel('Density', color=LABEL_COLOR, fontsize=13)
+    ax1.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+    ax1.spines['top'].set_visible(False)
+    ax1.spines['right'].set_visible(False)
+    
+    # Sample means and their histograms for every frame, computed up front so
+    # the axes limits can be fixed to fit all of them
+    means_by_frame = [compute_means(population, size, n_samples, rng)
+                      for size in sample_sizes]
+    mean_hists = [np.histogram(means, bins=MEAN_BINS, density=True)
+                  for means in means_by_frame]
+    peak_density = max(max(density.max() for density, _ in mean_hists),
+                       max(1 / (means.std() * np.sqrt(2 * np.pi)) for means in means_by_frame))
+    
+    # RIGHT PLOT: Sampling distribution. The bars are created once and moved
+    # onto each frame's bins.
+    ax2.patch.set_facecolor(BAND_COLOR)
+    pop_mu = population.mean()
+    mean_bars = ax2.bar(np.zeros(MEAN_BINS), np.zeros(MEAN_BINS), align='edge',
+                        color=BAR_COLORS[:MEAN_BINS],
+                        alpha=0.8, edgecolor='#17003b', linewidth=2)
+    
+    # Glowing normal curve (multiple layers for glow effect)
+    glow_lines = [
+        ax2.plot([], [], '-', linewidth=4, color=NORMAL_CURVE_COLOR, 
+                 alpha=0.3, zorder=10)[0],
+        ax2.plot([], [], '-', linewidth=2.5, color=NORMAL_CURVE_COLOR, 
+                 alpha=0.7, zorder=11)[0],
+        ax2.plot([], [], '-', linewidth=1.5, color='white', 
+                 alpha=0.9, zorder=12)[0],
+    ]
+    
+    # Mean line with glow
+    mean_lines = [
+        ax2.axvline(pop_mu, color=TITLE_COLOR, linestyle='--', linewidth=3, 
+                    alpha=0.4, zorder=8),
+        ax2.axvline(pop_mu, color=TITLE_COLOR, linestyle='--', linewidth=2, 
+                    alpha=0.9, zorder=9, label='μ, σ'),
+    ]
+    
+    # Static title; the current sample size is shown inside the axes so
+    # blitting (which only redraws the axes area) keeps it up to date
+    ax2.set_title(f'Sampling Distribution (samples={n_samples})', 
+                 fontweight='bold', color=TITLE_COLOR, fontsize=16)
+    size_text = ax2.text(0.02, 0.92, '', transform=ax2.transAxes,
+                         color=TITLE_COLOR, fontsize=12, fontweight='bold')
+    ax2.set_xlim(min(means.min() for means in means_by_frame),
+                 max(means.max() for means in means_by_frame))
+    ax2.set_ylim(0, peak_density * 1.1)
+    ax2.set_xlabel('Sample Mean', color=LABEL_COLOR, fontsize=13)
+    ax2.set_ylabel('Density', color=LABEL_COLOR, fontsize=13)
+    legend = ax2.legend(facecolor=BAND_COLOR, edgecolor=TITLE_COLOR, 
+                        fontsize=11, labelcolor=LABEL_COLOR, framealpha=0.9)
+    ax2.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
+    ax2.spines['top'].set_visible(False)
+    ax2.spines['right'].set_visible(False)
+    
+    # Scratch array for the curve's x values, refilled each frame
+    pdf_grid = np.linspace(0, 1, 200)
+    x_pdf = np.empty_like(pdf_grid)
+    
+    # Frame counter, created once and updated in place. It lives on the figure
+    # rather than an axes, so it is redrawn on full-frame saves, not blitted.
+    counter_text = fig.text(0.5, 0.02, '', 
+                            ha='center', color=TITLE_COLOR, fontsize=14, fontweight='bold')
+    
+    # Lay out once; frames never move the axes
+    fig.tight_layout(rect=[0, 0.03, 1, 1])
+    
+    artists = [*mean_bars, *glow_lines, *mean_lines, legend, size_text]
+    
     def init():
-        ax1.clear()
-        ax2.clear()
-        return ax1, ax2
+        for patch in mean_bars:
+            patch.set_height(0)
+        for line in glow_lines:
+            line.set_data([], [])
+        return artists
     
     def update(frame):
         sample_size = sample_sizes[frame]
         
-        # Clear axes
-        ax1.clear()
-        ax2.clear()
+        sample_means = means_by_frame[frame]
         
-        # LEFT PLOT: Population distribution (constant)
-        ax1.patch.set_facecolor(BAND_COLOR)
-        counts1, bins1, patches1 = ax1.hist(
-            population, 
-            bins=20, 
-            alpha=0.85, 
-            color=POPULATION_COLOR,
-            edgecolor='#38006b', 
-            density=True,
-            linewidth=2
-        )
+        density, edges = mean_hists[frame]
+        for patch, left, width, height in zip(mean_bars, edges, np.diff(edges), density):
+            patch.set_x(left)
+            patch.set_width(width)
+            patch.set_height(height)
         
-        # Apply gradient to population histogram
-        for i, patch in enumerate(patches1):
-            color_idx = i % len(MEAN_GRADIENT)
-            patch.set_facecolor(MEAN_GRADIENT[color_idx])
-            patch.set_alpha(0.8)
-        
-        ax1.set_title('Population Distribution', 
-                     fontweight='bold', color=TITLE_COLOR, fontsize=16)
-        ax1.set_xlabel('Value', color=LABEL_COLOR, fontsize=13)
-        ax1.set_ylabel('Density', color=LABEL_COLOR, fontsize=13)
-        ax1.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
-        ax1.spines['top'].set_visible(False)
-        ax1.spines['right'].set_visible(False)
-        
-        # RIGHT PLOT: Sampling distribution (changes with sample_size)
-        ax2.patch.set_facecolor(BAND_COLOR)
-        sample_means = [np.random.choice(population, size=sample_size).mean() 
-                       for _ in range(n_samples)]
-        
-        counts2, bins2, patches2 = ax2.hist(
-            sample_means, 
-            bins=30, 
-            alpha=0.85, 
-            color=CURVE_COLOR,
-            edgecolor='#17003b', 
-            density=True,
-            linewidth=2
-        )
-        
-        # Apply gradient to sampling distribution histogram
-        for i, patch in enumerate(patches2):
-            color_idx = i % len(MEAN_GRADIENT)
-            patch.set_facecolor(MEAN_GRADIENT[color_idx])
-            patch.set_alpha(0.8)
-        
-        # Normal curve overlay with glow effect
+        # Normal curve overlay
         mu = np.mean(sample_means)
         sigma = np.std(sample_means)
-        x = np.linspace(min(sample_means), max(sample_means), 200)
-        y_normal = norm.pdf(x, mu, sigma)
-        
-        # Draw glowing normal curve (multiple layers for glow effect)
-        ax2.plot(x, y_normal, '-', linewidth=4, color=NORMAL_CURVE_COLOR, 
-                alpha=0.3, zorder=10)
-        ax2.plot(x, y_normal, '-', linewidth=2.5, color=NORMAL_CURVE_COLOR, 
-                alpha=0.7, zorder=11)
-        ax2.plot(x, y_normal, '-', linewidth=1.5, color='white', 
-                alpha=0.9, zorder=12)
+        lo, hi = sample_means.min(), sample_means.max()
+        x = np.multiply(pdf_grid, hi - lo, out=x_pdf)
+        x += lo
+        y_normal = _fast_norm_pdf(x, mu, sigma)
+        for line in glow_lines:
+            line.set_data(x, y_normal)
         
-        # Mean line with glow
-        ax2.axvline(mu, color=TITLE_COLOR, linestyle='--', linewidth=3, 
-                   alpha=0.4, zorder=8)
-        ax2.axvline(mu, color=TITLE_COLOR, linestyle='--', linewidth=2, 
-                   alpha=0.9, zorder=9,
-                   label=f'μ={mu:.2f}, σ={sigma:.2f}')
+        for line in mean_lines:
+            line.set_xdata([mu, mu])
+        legend.get_texts()[0].set_text(f'μ={mu:.2f}, σ={sigma:.2f}')
         
-        ax2.set_title(f'Sampling Distribution (n={sample_size}, samples={n_samples})', 
-                     fontweight='bold', color=TITLE_COLOR, fontsize=16)
-        ax2.set_xlabel('Sample Mean', color=LABEL_COLOR, fontsize=13)
-        ax2.set_ylabel('Density', color=LABEL_COLOR, fontsize=13)
-        ax2.legend(facecolor=BAND_COLOR, edgecolor=TITLE_COLOR, 
-                  fontsize=11, labelcolor=LABEL_COLOR, framealpha=0.9)
-        ax2.grid(True, alpha=0.3, linestyle='-', linewidth=0.5)
-        ax2.spines['top'].set_visible(False)
-        ax2.spines['right'].set_visible(False)
+        size_text.set_text(f'n={sample_size}')
         
-        # Add frame counter
-        fig.text(0.5, 0.02, f'Sample Size: {sample_size}', 
-                ha='center', color=TITLE_COLOR, fontsize=14, fontweight='bold')
+        # Update frame counter
+        counter_text.set_text(f'Sample Size: {sample_size}')
         
-        plt.tight_layout(rect=[0, 0.03, 1, 1])
-        return ax1, ax2
+        return artists
     
     # Create animation
     anim = FuncAnimation(
@@ -140,17 +196,22 @@ def create_clt_gif(population, output_filename='clt_interactive.gif'):
         frames=len(sample_sizes), 
         init_func=init,
         interval=200,  # 200ms between frames
-        blit=False, 
+        blit=True, 
         repeat=True
     )
     
-    # Save as GIF
+    # Save as GIF (ffmpeg's palette-based GIF encoder when available, it is
+    # much faster than Pillow's per-frame quantization)
     print(f"Creating GIF with {len(sample_sizes)} frames...")
-    writer = PillowWriter(fps=5, metadata=dict(artist='CLT Demo'), bitrate=1800)
-    anim.save(output_filename, writer=writer, dpi=100)
+    if shutil.which('ffmpeg') is None:
+        writer = FixedPaletteGifWriter(GIF_PALETTE, fps=5, metadata=dict(artist='CLT Demo'))
+    else:
+        writer = FFMpegWriter(fps=5, metadata=dict(artist='CLT Demo'))
+    anim.save(output_filename, writer=writer, dpi=dpi,
+              savefig_kwargs={'facecolor': GRID_COLOR})
     print(f"✓ GIF saved as {output_filename}")
     
-    plt.close()
+    plt.close(fig)
     return anim
 
 
@@ -160,7 +221,7 @@ def create_clt_gif(population, output_filename='clt_interactive.gif'):
 
 if __name__ == "__main__":
     # Create population
-    population = np.random.randint(1, 101, size=1000)
+    population = rng.integers(1, 101, size=1000)
     
     # Generate and save as GIF
     print("Creating Interactive CLT Animation as GIF")
@@ -172,3 +233,5 @@ if __name__ == "__main__":
     print("For Medium blog:")
     print(" - Drag and drop the GIF directly into Medium editor")
     print(" - Or use the image upload button")
+    
+    plt.close('all')
@@ -0,0 +1,61 @@
+from io import BytesIO
+
+import numpy as np
+from matplotlib.animation import AbstractMovieWriter
+from matplotlib.colors import to_rgb
+from PIL import Image
+
+
+def build_palette(colors, backgrounds):
+    """
+    Build one fixed 256-entry GIF palette from a color scheme
+
+    Every color is blended toward each background at evenly spaced steps, so
+    antialiased edges and translucent fills still find a close palette entry
+    """
+    shades = max(2, min(16, 256 // (len(colors) * len(backgrounds))))
+    steps = np.linspace(0, 1, shades)[:, None]
+
+    entries = []
+    for bg in backgrounds:
+        bg_rgb = np.array(to_rgb(bg))
+        for color in colors:
+            entries.append(bg_rgb + steps * (np.array(to_rgb(color)) - bg_rgb))
+    entries = np.unique(np.round(np.concatenate(entries) * 255).astype(np.uint8), axis=0)
+
+    flat = entries[:256].ravel().tolist()
+    flat += flat[:3] * (256 - len(flat) // 3)  # pad unused slots with a real color
+    palette = Image.new('P', (1, 1))
+    palette.putpalette(flat)
+    return palette
+
+
+class FixedPaletteGifWriter(AbstractMovieWriter):
+    """
+    GIF writer that maps every frame onto one precomputed palette, instead of
+    letting Pillow compute a new adaptive palette for each frame
+    """
+
+    def __init__(self, palette, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.palette = palette
+
+    @classmethod
+    def isAvailable(cls):
+        return True
+
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi=dpi)
+        self._gif_frames = []
+
+    def grab_frame(self, **savefig_kwargs):
+        buf = BytesIO()
+        self.fig.savefig(buf, **{**savefig_kwargs, 'format': 'rgba', 'dpi': self.dpi})
+        frame = Image.frombuffer('RGBA', self.frame_size, buf.getbuffer(), 'raw', 'RGBA', 0, 1)
+        self._gif_frames.append(frame.convert('RGB').quantize(
+            palette=self.palette, dither=Image.Dither.NONE))
+
+    def finish(self):
+        self._gif_frames[0].save(
+            self.outfile, save_all=True, append_images=self._gif_frames[1:],
+            duration=int(1000 / self.fps), loop=0)
@@ -0,0 +1,41 @@
+import numpy as np
+
+# Optional: numba-compiled sample-mean kernel (falls back to NumPy if missing)
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _gather_means(population, idx):
+        out = np.empty(idx.shape[0])
+        for i in prange(idx.shape[0]):
+            s = 0.0
+            for j in range(idx.shape[1]):
+                s += population[idx[i, j]]
+            out[i] = s / idx.shape[1]
+        return out
+
+    def compute_means(population, size, n_samples, rng):
+        """
+        Return the means of n_samples random samples (with replacement) of given size
+
+        The indices come from rng, so seeding it makes the means reproducible;
+        only the gather-and-average runs compiled, without the (n_samples, size)
+        temporary that fancy indexing would allocate
+        """
+        idx = rng.integers(0, population.size, size=(n_samples, size))
+        return _gather_means(population, idx)
+
+    # Load (or compile) once up front so the first frame isn't charged for it
+    _gather_means(np.arange(2), np.zeros((1, 1), dtype=np.int64))
+else:
+    def compute_means(population, size, n_samples, rng):
+        """
+        Return the means of n_samples random samples (with replacement) of given size
+        """
+        return rng.choice(population, size=(n_samples, size)).mean(axis=1)
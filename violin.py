@@ -1,7 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation, PillowWriter
-import seaborn as sns
+from matplotlib.animation import FuncAnimation
+
+from gif_palette import FixedPaletteGifWriter, build_palette
+from sampling import compute_means
 
 # Techy cyberpunk color palette
 GRID_COLOR = '#0d1117'
@@ -10,6 +12,11 @@ LABEL_COLOR = '#ffde57'
 BAND_COLOR = '#1a1f2e'
 VIOLIN_COLORS = ['#4c47e4', '#792ec7', '#be23c4', '#f174ea', '#ff24a5', '#1ef9d3']
 
+# Every color the violins, their outlines and the labels are drawn in
+GIF_PALETTE = build_palette(
+    [*VIOLIN_COLORS, TITLE_COLOR, LABEL_COLOR, '#ffffff', '#2A3459'],
+    [GRID_COLOR, BAND_COLOR])
+
 # Set matplotlib style globally
 plt.style.use('dark_background')
 plt.rcParams['figure.facecolor'] = GRID_COLOR
@@ -21,23 +28,70 @@ plt.rcParams['ytick.color'] = LABEL_COLOR
 plt.rcParams['grid.color'] = '#2A3459'
 plt.rcParams['font.family'] = 'DejaVu Sans'
 
+rng = np.random.default_rng()
+
+
+def compute_means_by_size(population, sizes, n_samples):
+    """
+    Map each sample size to its sample means
+    """
+    return {size: compute_means(population, size, n_samples, rng) for size in sizes}
+
+
 def clt_violin_comparison_gif(population, max_sample_size=100, 
-                               output_filename='clt_violin_techy.gif'):
+                               output_filename='clt_violin_techy.gif', dpi=100):
     """
     Animated violin plots showing distribution shape evolution as sample size increases
     """
-    fig, ax = plt.subplots(figsize=(14, 7), facecolor=GRID_COLOR)
+    fig, ax = plt.subplots(figsize=(14, 7), dpi=dpi, facecolor=GRID_COLOR)
     
     # Generate all sample sizes to animate through
     sample_size_progression = list(range(5, max_sample_size + 1, 5))
     
+    # Generate sample means once per sample size; frames reuse them
+    means_by_size = compute_means_by_size(population, sample_size_progression, 1000)
+    
+    # Axes styling and limits are set once; frames only swap the violins.
+    # The widest spread comes from the smallest sample size.
+    ax.set_facecolor(BAND_COLOR)
+    ax.set_xlabel('Sample Size', fontsize=13, fontweight='bold', color=LABEL_COLOR)
+    ax.set_ylabel('Sample Mean', fontsize=13, fontweight='bold', color=LABEL_COLOR)
+    ax.set_title('CLT: Distribution Shape Evolution\n(Violin Plots)', 
+                fontsize=16, fontweight='bold', color=TITLE_COLOR, pad=20)
+    y_min = min(means.min() for means in means_by_size.values())
+    y_max = max(means.max() for means in means_by_size.values())
+    y_pad = 0.05 * (y_max - y_min)
+    ax.set_ylim(y_min - y_pad, y_max + y_pad)
+    ax.set_autoscale_on(False)
+    
+    # Grid styling
+    ax.grid(True, alpha=0.3, axis='y', linestyle='-', linewidth=0.8)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.spines['left'].set_color(LABEL_COLOR)
+    ax.spines['bottom'].set_color(LABEL_COLOR)
+    
+    # Lay out once, leaving room for the progress indicator
+    fig.tight_layout(rect=[0, 0.04, 1, 1])
+    
+    # Artists from the previous frame's violinplot
+    violin_artists = []
+    
+    # Progress indicator, created once and updated in place
+    progress_artist = fig.text(0.5, 0.02, '', 
+                               ha='center', color=TITLE_COLOR, fontsize=11, fontweight='bold')
+    
+    def clear_violins():
+        for artist in violin_artists:
+            artist.remove()
+        violin_artists.clear()
+    
     def init():
-        ax.clear()
+        clear_violins()
         return fig,
     
     def update(frame):
-        ax.clear()
-        ax.set_facecolor(BAND_COLOR)
+        clear_violins()
         
         # Get current sample sizes (progressively add more)
         current_sample_sizes = sample_size_progression[:frame+1]
@@ -51,15 +105,8 @@ def clt_violin_comparison_gif(population, max_sample_size=100,
                                 min(8, len(current_sample_sizes)), dtype=int)
             display_sizes = [current_sample_sizes[i] for i in indices]
         
-        sample_means_list = []
-        labels = []
-        
-        # Generate sample means for each sample size
-        for size in display_sizes:
-            means = [np.random.choice(population, size=size).mean() 
-                    for _ in range(1000)]
-            sample_means_list.append(means)
-            labels.append(f'n={size}')
+        sample_means_list = [means_by_size[size] for size in display_sizes]
+        labels = [f'n={size}' for size in display_sizes]
         
         # Create violin plot
         parts = ax.violinplot(sample_means_list, 
@@ -67,6 +114,7 @@ def clt_violin_comparison_gif(population, max_sample_size=100,
                              showmeans=True, 
                              showmedians=True,
                              widths=0.7)
+        violin_artists.extend(parts['bodies'])
         
         # Style the violin bodies with cyberpunk colors
         for i, pc in enumerate(parts['bodies']):
@@ -83,28 +131,17 @@ def clt_violin_comparison_gif(population, max_sample_size=100,
                 vp.set_edgecolor(TITLE_COLOR)
                 vp.set_linewidth(2)
                 vp.set_alpha(0.9)
+                violin_artists.append(vp)
         
-        # Set labels and title
+        # Set tick labels for the violins currently shown
         ax.set_xticks(range(len(display_sizes)))
         ax.set_xticklabels(labels, fontsize=11, fontweight='bold')
-        ax.set_xlabel('Sample Size', fontsize=13, fontweight='bold', color=LABEL_COLOR)
-        ax.set_ylabel('Sample Mean', fontsize=13, fontweight='bold', color=LABEL_COLOR)
-        ax.set_title('CLT: Distribution Shape Evolution\n(Violin Plots)', 
-                    fontsize=16, fontweight='bold', color=TITLE_COLOR, pad=20)
+        ax.set_xlim(-0.5, len(display_sizes) - 0.5)
         
-        # Grid styling
-        ax.grid(True, alpha=0.3, axis='y', linestyle='-', linewidth=0.8)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_color(LABEL_COLOR)
-        ax.spines['bottom'].set_color(LABEL_COLOR)
-        
-        # Add progress indicator
+        # Update progress indicator
         progress_text = f'Progress: {frame+1}/{len(sample_size_progression)} | Max n={current_sample_sizes[-1]}'
-        fig.text(0.5, 0.02, progress_text, 
-                ha='center', color=TITLE_COLOR, fontsize=11, fontweight='bold')
+        progress_artist.set_text(progress_text)
         
-        plt.tight_layout(rect=[0, 0.04, 1, 1])
         return fig,
     
     # Create animation
@@ -123,11 +160,12 @@ def clt_violin_comparison_gif(population, max_sample_size=100,
     
     # Save as GIF
     print(f"Saving GIF (this may take a moment)...")
-    writer = PillowWriter(fps=7, metadata=dict(artist='CLT Violin Demo'), bitrate=1800)
-    anim.save(output_filename, writer=writer, dpi=100)
+    writer = FixedPaletteGifWriter(GIF_PALETTE, fps=7, metadata=dict(artist='CLT Violin Demo'))
+    anim.save(output_filename, writer=writer, dpi=dpi,
+              savefig_kwargs={'facecolor': GRID_COLOR})
     print(f"✓ GIF saved as {output_filename}")
     
-    plt.close()
+    plt.close(fig)
     return anim
 
 
@@ -139,14 +177,9 @@ def clt_violin_comparison_static(population, sample_sizes=[5, 15, 30, 50, 100],
     fig, ax = plt.subplots(figsize=(14, 7), facecolor=GRID_COLOR)
     ax.set_facecolor(BAND_COLOR)
     
-    sample_means_list = []
-    labels = []
-    
-    for size in sample_sizes:
-        means = [np.random.choice(population, size=size).mean() 
-                for _ in range(1000)]
-        sample_means_list.append(means)
-        labels.append(f'n={size}')
+    means_by_size = compute_means_by_size(population, sample_sizes, 1000)
+    sample_means_list = [means_by_size[size] for size in sample_sizes]
+    labels = [f'n={size}' for size in sample_sizes]
     
     # Create violin plot
     parts = ax.violinplot(sample_means_list, 
@@ -195,7 +228,7 @@ def clt_violin_comparison_static(population, sample_sizes=[5, 15, 30, 50, 100],
 
 if __name__ == "__main__":
     # Create population
-    population = np.random.randint(1, 101, size=1000)
+    population = rng.integers(1, 101, size=1000)
     
     print(" Creating Violin Plot CLT Visualization")
     print("This shows how distribution shape tightens with sample size\n")
@@ -219,3 +252,5 @@ if __name__ == "__main__":
     print("For Medium blog:")
     print("   - Upload the animated GIF to show progressive evolution")
     print("   - Use the static PNG for a clean comparison view")
+    
+    plt.close('all')